@@ -5,14 +5,14 @@ Features: Multi-graph display, configurable axes, connection management
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
+import os
 import threading
-import queue
 import time
 import math
 import random
 import json
-from datetime import datetime
+import struct
 from collections import deque
 
 # Optional imports - will gracefully handle if not installed
@@ -32,16 +32,202 @@ try:
 except ImportError:
     SOCKET_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def y_bucket(min_y, max_y):
+    """Snap a Y range outward to a round 1/2/5 step so the grid stays put between frames"""
+    if max_y == min_y:
+        return min_y, min_y + 1
+    step = 10 ** math.floor(math.log10((max_y - min_y) / 5))
+    for mult in (1, 2, 5, 10):
+        if step * mult >= (max_y - min_y) / 5:
+            step *= mult
+            break
+    return math.floor(min_y / step) * step, math.ceil(max_y / step) * step
+
+
+# Telemetry decoder - orjson is several times faster than the stdlib when installed.
+# Both accept bytes, so packets don't need to be decoded to str first.
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def decode_packet(line):
+    """Decode one JSON telemetry line; valid JSON that isn't an object is no packet"""
+    data = json_loads(line)
+    return data if isinstance(data, dict) else None
+
+
+# Binary frame: 4-byte little-endian length prefix, then six float32 values, a
+# NUL-padded ASCII phase name and a checksum byte (sum of the bytes before it,
+# mod 256). Compiled once so frames skip format parsing.
+PHASE_SIZE = 16
+FRAME_HEADER = struct.Struct('<I')
+BINARY_FRAME = struct.Struct(f'<ffffff{PHASE_SIZE}sB')
+BINARY_FIELDS = ('altitude', 'velocity', 'acceleration', 'temperature', 'pressure', 'flight_time')
+
+# Every valid frame has the same length, so its prefix doubles as a sync marker
+FRAME_PREFIX = FRAME_HEADER.pack(BINARY_FRAME.size)
+FRAME_SIZE = FRAME_HEADER.size + BINARY_FRAME.size
+
+
+def binary_loads(payload):
+    """Decode a binary telemetry frame into the same dict as the JSON path, or None if damaged"""
+    *values, phase, checksum = BINARY_FRAME.unpack(payload)
+    phase = phase.rstrip(b'\0')
+    if (sum(payload[:-1]) & 0xFF != checksum or not phase.isascii()
+            or not phase.decode('ascii').isprintable()):
+        return None
+    data = dict(zip(BINARY_FIELDS, values))
+    data['phase'] = phase.decode('ascii')
+    return data
+
+
+# (second, "HH:MM:SS") of the last timestamp - one tuple so threads never see a mismatched pair
+_last_second = (None, '')
+
+
+def timestamp():
+    """Wall-clock time as HH:MM:SS.mmm, running strftime at most once per second"""
+    global _last_second
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _last_second
+    if second != cached_second:
+        prefix = time.strftime('%H:%M:%S', time.localtime(second))
+        _last_second = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1000):03d}"
+
+
+def tune_reader_thread():
+    """Best effort: pin the calling thread to one core and raise its priority"""
+    # Linux applies both per thread; elsewhere these are missing or need privileges
+    if hasattr(os, 'sched_setaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+        if len(cpus) > 1:
+            try:
+                os.sched_setaffinity(0, {cpus[-1]})
+            except OSError:
+                pass
+    if hasattr(os, 'nice'):
+        try:
+            os.nice(-5)
+        except OSError:
+            pass
+
+
+class RingBuffer:
+    """Fixed-size history buffer, backed by a NumPy array when available"""
+
+    def __init__(self, size, data=None):
+        self.size = size
+        self.head = 0
+        self.count = 0
+        # Every value is stored twice, size slots apart, so the newest `count`
+        # values are always one contiguous slice - window() never has to stitch
+        # the wrapped halves together
+        if data is None:
+            data = np.empty(2 * size) if NUMPY_AVAILABLE else [0.0] * (2 * size)
+        self.data = data
+
+    @classmethod
+    def group(cls, keys, size):
+        """One buffer per key; with NumPy they are rows of a single contiguous block"""
+        if not NUMPY_AVAILABLE:
+            return {key: cls(size) for key in keys}
+        block = np.empty((len(keys), 2 * size))
+        return {key: cls(size, row) for key, row in zip(keys, block)}
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value):
+        self.data[self.head] = value
+        self.data[self.head + self.size] = value
+        self.head = (self.head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def extend(self, values):
+        """Append a batch with slice copies instead of one append per value"""
+        values = values[-self.size:]
+        n = len(values)
+        first = min(n, self.size - self.head)
+        for offset in (self.head, self.head + self.size):
+            self.data[offset:offset + first] = values[:first]
+        for offset in (0, self.size):
+            self.data[offset:offset + n - first] = values[first:]
+        self.head = (self.head + n) % self.size
+        self.count = min(self.count + n, self.size)
+
+    def window(self):
+        """Return stored values, oldest first (a view, not a copy, with NumPy)"""
+        end = self.head + self.size
+        return self.data[end - self.count:end]
+
+
+# Samples kept for the graphs (25 s at 20 Hz)
+HISTORY_SIZE = 500
+
+# Samples the reader thread may queue ahead of the GUI before the oldest are
+# dropped, and the most the GUI takes off the queue per update
+QUEUE_SIZE = 256
+MAX_DRAIN = 64
+
+# Seconds between telemetry log refreshes. Status messages and phase changes
+# are shown on the next frame instead.
+LOG_INTERVAL = 1.0
+
+# Pixels between the canvas edge and the plot area
+GRAPH_PADDING = 40
+
+# History buffer name -> telemetry field it records
+HISTORY_FIELDS = (
+    ('time', 'flight_time'),
+    ('altitude', 'altitude'),
+    ('velocity', 'velocity'),
+    ('acceleration', 'acceleration'),
+    ('temperature', 'temperature'),
+    ('pressure', 'pressure'),
+)
+
+# Graphable fields and their axis titles
+Y_LABELS = {
+    'altitude': 'Altitude (m)',
+    'velocity': 'Velocity (m/s)',
+    'acceleration': 'Acceleration (m/s²)',
+    'temperature': 'Temperature (°C)',
+    'pressure': 'Pressure (kPa)'
+}
+
 
 class DataSource:
     """Base class for data sources"""
 
     def __init__(self):
         self.connected = False
+        self.lost = None  # Why the link dropped, if it wasn't disconnect()
 
     def connect(self):
         raise NotImplementedError
 
+    def link_lost(self, reason):
+        """Mark the link as dropped from the other end, for the GUI to report"""
+        if self.connected:
+            self.lost = reason
+        self.connected = False
+
     def disconnect(self):
         raise NotImplementedError
 
@@ -49,18 +235,92 @@ class DataSource:
         raise NotImplementedError
 
 
+# Simulated flight profile
+SIM_STEP = 0.1        # Flight seconds per sample
+G = 9.8
+LAUNCH_TIME = 2
+BURN_TIME = 13
+COAST_DECEL = 3
+COAST_TIME = 10
+APOGEE_HOLD = 2
+DESCENT_RATE = 5
+LANDING_TIME = 50
+BURNOUT_TIME = LAUNCH_TIME + BURN_TIME
+APOGEE_TIME = BURNOUT_TIME + COAST_TIME
+DESCENT_TIME = APOGEE_TIME + APOGEE_HOLD
+MAX_VEL = G * BURN_TIME
+BURNOUT_ALT = 0.5 * G * BURN_TIME ** 2
+APOGEE = BURNOUT_ALT + MAX_VEL * COAST_TIME - 0.5 * COAST_DECEL * COAST_TIME ** 2
+
+# Simulated atmosphere
+GROUND_TEMP = 20           # C
+LAPSE_RATE = 0.0065        # C per meter
+SEA_LEVEL_PRESSURE = 101.325  # kPa
+SCALE_HEIGHT = 8500        # m
+
+# Simulator noise: how many samples to draw at once, and the amplitude of the
+# acceleration (scaled again by the phase jitter), altitude, temperature and
+# pressure noise
+NOISE_BATCH = 1024
+NOISE_SCALE = (1, 2, 1, 0.1)
+
+
+def flight_profile(t):
+    """Return (phase, altitude, velocity, acceleration, acceleration noise) at flight time t"""
+    if t < LAUNCH_TIME:
+        return "Pre-Launch", 0, 0, 0, 0
+    if t < BURNOUT_TIME:
+        t -= LAUNCH_TIME
+        return "Powered Ascent", 0.5 * G * t ** 2, G * t, G, 0.5
+    if t < APOGEE_TIME:
+        t -= BURNOUT_TIME
+        return ("Coasting", BURNOUT_ALT + MAX_VEL * t - 0.5 * COAST_DECEL * t ** 2,
+                MAX_VEL - COAST_DECEL * t, -COAST_DECEL, 0.2)
+    if t < DESCENT_TIME:
+        return "Apogee", APOGEE, 0, 0, 0
+    if t < LANDING_TIME:
+        return "Descent", APOGEE - DESCENT_RATE * (t - DESCENT_TIME), -DESCENT_RATE, -1, 0.1
+    return "Landed", 0, 0, 0, 0
+
+
+# One entry per simulator step, so read_data is a single lookup
+FLIGHT_TABLE = [flight_profile(i * SIM_STEP) for i in range(int(60 / SIM_STEP) + 1)]
+
+# Pressure at each table altitude. read_data only adds a couple of meters of
+# noise, so it corrects for that with the first-order term of exp() - off by
+# less than 1e-5 kPa, well under the 0.01 the value is rounded to.
+PRESSURE_TABLE = [SEA_LEVEL_PRESSURE * math.exp(-row[1] / SCALE_HEIGHT) for row in FLIGHT_TABLE]
+
+
 class SimulatorSource(DataSource):
     """Simulated rocket data"""
 
     def __init__(self):
         super().__init__()
         self.time = 0
+        self.step = 0
+        self.next_tick = 0
+        self.rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+        self.noise = []
 
     def connect(self):
         self.connected = True
         self.time = 0
+        self.step = 0
+        self.next_tick = time.monotonic()
         return True, "Simulator started"
 
+    def next_noise(self):
+        """Return the four noise values for one sample, generated in batches with NumPy"""
+        if self.rng is None:
+            uniform = random.uniform
+            return [scale * uniform(-1, 1) for scale in NOISE_SCALE]
+        if not self.noise:
+            batch = self.rng.uniform(-1, 1, size=(NOISE_BATCH, len(NOISE_SCALE)))
+            batch *= NOISE_SCALE
+            self.noise = batch.tolist()
+        return self.noise.pop()
+
     def disconnect(self):
         self.connected = False
 
@@ -68,70 +328,55 @@ class SimulatorSource(DataSource):
         if not self.connected:
             return None
 
-        self.time += 0.1
-
-        # Flight phases
-        if self.time < 2:
-            phase = "Pre-Launch"
-            altitude = 0
-            velocity = 0
-            acceleration = 0
-        elif self.time < 15:
-            phase = "Powered Ascent"
-            altitude = 0.5 * 9.8 * (self.time - 2) ** 2
-            velocity = 9.8 * (self.time - 2)
-            acceleration = 9.8 + random.uniform(-0.5, 0.5)
-        elif self.time < 25:
-            phase = "Coasting"
-            max_vel = 9.8 * 13
-            altitude = (0.5 * 9.8 * 13 ** 2) + max_vel * (self.time - 15) - 0.5 * 3 * (self.time - 15) ** 2
-            velocity = max_vel - 3 * (self.time - 15)
-            acceleration = -3 + random.uniform(-0.2, 0.2)
-        elif self.time < 27:
-            phase = "Apogee"
-            altitude = (0.5 * 9.8 * 13 ** 2) + 9.8 * 13 * 10 - 0.5 * 3 * 10 ** 2
-            velocity = 0
-            acceleration = 0
-        elif self.time < 50:
-            phase = "Descent"
-            apogee = (0.5 * 9.8 * 13 ** 2) + 9.8 * 13 * 10 - 0.5 * 3 * 10 ** 2
-            altitude = apogee - 5 * (self.time - 27)
-            velocity = -5
-            acceleration = -1 + random.uniform(-0.1, 0.1)
+        # Pace ourselves to 20 Hz on a fixed schedule - the reader thread doesn't
+        # sleep between reads. After a stall, skip missed ticks instead of bursting.
+        self.next_tick += 0.05
+        delay = self.next_tick - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
         else:
-            phase = "Landed"
-            altitude = 0
-            velocity = 0
-            acceleration = 0
+            self.next_tick = time.monotonic()
+
+        self.step += 1
+        self.time = self.step * SIM_STEP
+        accel_noise, alt_noise, temp_noise, pressure_noise = self.next_noise()
 
-        altitude = max(0, altitude + random.uniform(-2, 2))
+        index = min(self.step, len(FLIGHT_TABLE) - 1)
+        phase, profile_alt, velocity, acceleration, accel_jitter = FLIGHT_TABLE[index]
+        acceleration += accel_jitter * accel_noise
+
+        altitude = max(0, profile_alt + alt_noise)
+        pressure = PRESSURE_TABLE[index] * (1 - (altitude - profile_alt) / SCALE_HEIGHT)
 
         return {
-            'timestamp': datetime.now().strftime('%H:%M:%S.%f')[:-3],
+            'timestamp': timestamp(),
             'flight_time': round(self.time, 2),
             'phase': phase,
             'altitude': round(altitude, 2),
             'velocity': round(velocity, 2),
             'acceleration': round(acceleration, 2),
-            'temperature': round(20 - altitude * 0.0065 + random.uniform(-1, 1), 2),
-            'pressure': round(101.325 * math.exp(-altitude / 8500) + random.uniform(-0.1, 0.1), 2),
+            'temperature': round(GROUND_TEMP - altitude * LAPSE_RATE + temp_noise, 2),
+            'pressure': round(pressure + pressure_noise, 2),
         }
 
 
 class SerialSource(DataSource):
     """Serial port data source"""
 
-    def __init__(self, port, baudrate=9600):
+    def __init__(self, port, baudrate=9600, data_format='json'):
         super().__init__()
         self.port = port
         self.baudrate = baudrate
+        self.data_format = data_format
         self.serial = None
+        self.pending = b''  # Binary mode: bytes read but not yet part of a frame
 
     def connect(self):
         if not SERIAL_AVAILABLE:
             return False, "pyserial not installed"
         try:
             self.serial = serial.Serial(self.port, self.baudrate, timeout=1)
+            self.pending = b''
             time.sleep(2)  # Wait for connection
             self.connected = True
             return True, f"Connected to {self.port}"
@@ -139,31 +384,68 @@ class SerialSource(DataSource):
             return False, str(e)
 
     def disconnect(self):
+        # Cleared first so the read this interrupts isn't reported as an error
+        self.connected = False
         if self.serial:
             self.serial.close()
-        self.connected = False
 
     def read_data(self):
         if not self.connected or not self.serial:
             return None
         try:
-            if self.serial.in_waiting:
-                line = self.serial.readline().decode('utf-8').strip()
+            # Blocks until data arrives or the 1 s port timeout expires
+            if self.data_format == 'binary':
+                return self.read_frame()
+
+            line = self.serial.readline().strip()
+            if line:
                 # Expecting JSON format: {"altitude": 100, "velocity": 50, ...}
-                return json.loads(line)
+                return decode_packet(line)
+        except serial.SerialException as e:
+            self.link_lost(f"Serial port error: {e}")  # e.g. adapter unplugged
         except Exception as e:
-            print(f"Serial read error: {e}")
+            if self.connected:
+                print(f"Serial read error: {e}")
         return None
 
+    def read_frame(self):
+        """Read one binary frame, resyncing on the next intact frame after damage"""
+        # Dropped or corrupted bytes leave us mid-frame. A prefix only counts if
+        # the frame behind it passes binary_loads' checks; otherwise the search
+        # moves on one byte, so a truncated frame can't swallow the next one.
+        # Unused bytes are kept for the next call.
+        buf = self.pending
+        while True:
+            start = buf.find(FRAME_PREFIX)
+            if start < 0:
+                buf = buf[-(len(FRAME_PREFIX) - 1):]  # May hold the start of a prefix
+            else:
+                buf = buf[start:]
+                if len(buf) >= FRAME_SIZE:
+                    data = binary_loads(buf[FRAME_HEADER.size:FRAME_SIZE])
+                    if data is not None:
+                        self.pending = buf[FRAME_SIZE:]
+                        return data
+                    buf = buf[1:]
+                    continue
+
+            chunk = self.serial.read(FRAME_SIZE - len(buf))
+            if not chunk:
+                self.pending = buf
+                return None  # Timed out - the next call carries on from here
+            buf += chunk
+
 
 class TCPSocketSource(DataSource):
     """TCP Socket data source"""
 
-    def __init__(self, host, port):
+    def __init__(self, host, port, data_format='json'):
         super().__init__()
         self.host = host
         self.port = port
+        self.data_format = data_format
         self.socket = None
+        self.rfile = None
 
     def connect(self):
         if not SOCKET_AVAILABLE:
@@ -172,31 +454,74 @@ class TCPSocketSource(DataSource):
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(5)
             self.socket.connect((self.host, self.port))
+            # Buffered reader: one recv() fills many lines/frames. A file object
+            # can't survive a socket timeout, so reads block and disconnect()
+            # wakes them with shutdown().
+            self.socket.settimeout(None)
+            self.rfile = self.socket.makefile('rb', buffering=65536)
             self.connected = True
             return True, f"Connected to {self.host}:{self.port}"
         except Exception as e:
             return False, str(e)
 
     def disconnect(self):
+        self.connected = False
         if self.socket:
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             self.socket.close()
-        self.connected = False
+        if self.rfile:
+            self.rfile.close()
 
     def read_data(self):
-        if not self.connected or not self.socket:
+        if not self.connected or not self.rfile:
             return None
         try:
-            self.socket.settimeout(0.1)
-            data = self.socket.recv(1024).decode('utf-8').strip()
-            if data:
-                # Expecting JSON format
-                return json.loads(data)
-        except socket.timeout:
-            pass
+            if self.data_format == 'binary':
+                return self.read_frame()
+
+            line = self.rfile.readline()
+            if not line:
+                self.link_lost("Socket closed by remote host")
+                return None
+
+            line = line.strip()
+            if line:
+                # Expecting JSON format, one object per line
+                return decode_packet(line)
+        except OSError as e:
+            self.link_lost(f"Socket error: {e}")  # e.g. connection reset
         except Exception as e:
-            print(f"Socket read error: {e}")
+            if self.connected:
+                print(f"Socket read error: {e}")
         return None
 
+    def read_frame(self):
+        """Read one length-prefixed binary frame"""
+        header = self.rfile.read(4)
+        if len(header) < 4:
+            self.link_lost("Socket closed by remote host")
+            return None
+
+        # TCP doesn't corrupt bytes, so a wrong length means the sender is
+        # broken - drop the link rather than read an arbitrary amount
+        if header != FRAME_PREFIX:
+            self.link_lost(f"Bad frame length {FRAME_HEADER.unpack(header)[0]}")
+            self.disconnect()
+            return None
+
+        payload = self.rfile.read(BINARY_FRAME.size)
+        if len(payload) < BINARY_FRAME.size:
+            self.link_lost("Socket closed by remote host")
+            return None
+        data = binary_loads(payload)
+        if data is None:
+            self.link_lost("Damaged binary frame")
+            self.disconnect()
+        return data
+
 
 class TelemetryGUI:
     """Enhanced GUI with multiple graphs and connection options"""
@@ -208,24 +533,42 @@ class TelemetryGUI:
         self.root.configure(bg='#0a0e27')
 
         # Data management
-        self.data_queue = queue.Queue()
-        self.data_history = {
-            'time': deque(maxlen=500),
-            'altitude': deque(maxlen=500),
-            'velocity': deque(maxlen=500),
-            'acceleration': deque(maxlen=500),
-            'temperature': deque(maxlen=500),
-            'pressure': deque(maxlen=500),
-        }
+        # Single producer (reader thread) / single consumer (Tk loop): deque
+        # append/popleft are atomic under the GIL, so no Queue locks are needed.
+        # When full the oldest sample is evicted; the reader counts those drops.
+        self.data_queue = deque(maxlen=QUEUE_SIZE)
+        self.dropped = 0
+        self._dropped_reported = 0
+        self.data_history = RingBuffer.group([key for key, _ in HISTORY_FIELDS], HISTORY_SIZE)
 
         # Connection management
         self.data_source = None
         self.running = False
         self.reader_thread = None
+        self._stop = threading.Event()
+
+        # Graphs and log are redrawn on their own ~15 fps tick, not per sample
+        self._dirty = False
+        self._render_pending = False
+        self._log_buf = deque(maxlen=5)  # Lines not yet shown
+        self._log_dirty = False
+        self._log_urgent = False
+        self._log_flushed = 0.0
+        self._log_phase = None
+        self._next_update = time.monotonic()
+
+        # Most recent value of every field, and the text shown on each data card
+        self._latest = {}
+        self._card_text = {}
+
+        # (text, colour) of the status label while an error flash is showing
+        self._status_flash = None
 
         # Create UI
         self.create_widgets()
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
         self.update_gui()
+        self._render_tick()
 
     def create_widgets(self):
         """Create all UI elements"""
@@ -268,8 +611,10 @@ class TelemetryGUI:
                                      bg='#1a1f3a', fg='#ff4444')
         self.status_label.grid(row=2, column=0, columnspan=2, pady=5, sticky='w', padx=10)
 
-        self.phase_label = tk.Label(top_frame, text="Phase: --",
-                                    font=('Arial', 11), bg='#1a1f3a', fg='#ffaa00')
+        self.phase_var = tk.StringVar(value="Phase: --")
+        self.phase_label = tk.Label(top_frame, textvariable=self.phase_var,
+                                    font=('Arial', 11), width=len("Phase: ") + PHASE_SIZE,
+                                    anchor='w', bg='#1a1f3a', fg='#ffaa00')
         self.phase_label.grid(row=2, column=2, columnspan=2, pady=5, sticky='w')
 
         # Main content area
@@ -320,14 +665,18 @@ class TelemetryGUI:
         tk.Label(card, text=label, font=('Arial', 10),
                  bg='#1a1f3a', fg='#888888').pack(pady=(8, 2))
 
-        value_label = tk.Label(card, text="--", font=('Arial', 28, 'bold'),
-                               bg='#1a1f3a', fg='#00ff88')
+        # Fixed width, so a new value never changes the label's requested size
+        # and Tk doesn't have to re-pack the cards around it
+        value_var = tk.StringVar(value="--")
+        value_label = tk.Label(card, textvariable=value_var, font=('Arial', 28, 'bold'),
+                               width=8, bg='#1a1f3a', fg='#00ff88')
         value_label.pack()
 
         tk.Label(card, text=unit, font=('Arial', 9),
                  bg='#1a1f3a', fg='#666666').pack(pady=(0, 8))
 
         setattr(self, attr_name, value_label)
+        setattr(self, f"{attr_name}_var", value_var)
 
     def create_graph_panel(self, parent, graph_name, row):
         """Create graph panel with controls"""
@@ -343,18 +692,74 @@ class TelemetryGUI:
 
         y_var = tk.StringVar(value="altitude" if graph_name == "graph1" else "velocity")
         y_menu = ttk.Combobox(control_frame, textvariable=y_var,
-                              values=["altitude", "velocity", "acceleration", "temperature", "pressure"],
+                              values=list(Y_LABELS),
                               state='readonly', width=12, font=('Arial', 9))
         y_menu.pack(side='left', padx=5)
+        y_menu.bind('<<ComboboxSelected>>', lambda event: self.on_graph_var_changed(graph_name))
 
         setattr(self, f"{graph_name}_y_var", y_var)
         setattr(self, f"{graph_name}_y_menu", y_menu)
+        setattr(self, f"{graph_name}_y_field", y_var.get())
 
         # Canvas
         canvas = tk.Canvas(frame, bg='#0a0e27', highlightthickness=0, height=180)
         canvas.pack(fill='both', expand=True, padx=5, pady=5)
 
         setattr(self, f"{graph_name}_canvas", canvas)
+        setattr(self, f"{graph_name}_size", (0, 0))
+        canvas.bind('<Configure>', lambda event: self.on_canvas_resized(graph_name, event))
+
+        # Persistent items - draw_graph moves/updates these instead of recreating them
+        canvas.create_line(0, 0, 0, 0, fill='#444444', width=2, state='hidden', tags='axis_x')
+        canvas.create_line(0, 0, 0, 0, fill='#444444', width=2, state='hidden', tags='axis_y')
+        grid_lines = [canvas.create_line(0, 0, 0, 0, fill='#222222', dash=(2, 4), state='hidden')
+                      for _ in range(5)]
+        grid_labels = [canvas.create_text(0, 0, text="", anchor='e', fill='#666666',
+                                          font=('Arial', 8), state='hidden')
+                       for _ in range(5)]
+        canvas.create_text(0, 0, text="Flight Time (s)", fill='#888888',
+                           font=('Arial', 9), state='hidden', tags='title_x')
+        canvas.create_text(0, 0, text=Y_LABELS[y_var.get()], fill='#888888', font=('Arial', 9),
+                           angle=90, state='hidden', tags='title_y')
+        data_line = canvas.create_line(0, 0, 0, 0, fill='#00ff88', width=2, state='hidden')
+
+        setattr(self, f"{graph_name}_line_id", data_line)
+        setattr(self, f"{graph_name}_grid_lines", grid_lines)
+        setattr(self, f"{graph_name}_grid_labels", grid_labels)
+        if NUMPY_AVAILABLE:
+            # Reused every frame for the interleaved x/y pixel coordinates
+            setattr(self, f"{graph_name}_points", np.empty(2 * HISTORY_SIZE))
+            setattr(self, f"{graph_name}_pixels", np.empty(2 * HISTORY_SIZE, dtype=np.int32))
+        setattr(self, f"{graph_name}_visible", False)
+        setattr(self, f"{graph_name}_last_bucket", None)
+
+    def on_graph_var_changed(self, graph_name):
+        """Retitle the Y axis and rescale the graph for the newly selected field"""
+        y_field = getattr(self, f"{graph_name}_y_var").get()
+        setattr(self, f"{graph_name}_y_field", y_field)
+        getattr(self, f"{graph_name}_canvas").itemconfigure('title_y', text=Y_LABELS[y_field])
+        setattr(self, f"{graph_name}_last_bucket", None)
+        self._request_redraw()
+
+    def on_canvas_resized(self, graph_name, event):
+        """Cache the canvas size and move the static graph items to fit it"""
+        width, height = event.width, event.height
+        setattr(self, f"{graph_name}_size", (width, height))
+
+        canvas = getattr(self, f"{graph_name}_canvas")
+        padding = GRAPH_PADDING
+        graph_height = height - 2 * padding
+        canvas.coords('axis_x', padding, height - padding, width - padding, height - padding)
+        canvas.coords('axis_y', padding, padding, padding, height - padding)
+        for i, (grid_line, grid_label) in enumerate(zip(getattr(self, f"{graph_name}_grid_lines"),
+                                                        getattr(self, f"{graph_name}_grid_labels"))):
+            y = padding + (graph_height * i / 4)
+            canvas.coords(grid_line, padding, y, width - padding, y)
+            canvas.coords(grid_label, padding - 5, y)
+        canvas.coords('title_x', width / 2, height - 10)
+        canvas.coords('title_y', 15, height / 2)
+
+        self._request_redraw()
 
     def on_source_changed(self, event=None):
         """Update parameter inputs based on source type"""
@@ -383,6 +788,8 @@ class TelemetryGUI:
                                      width=8, state='readonly')
             baud_menu.grid(row=0, column=3, padx=2)
 
+            self.create_format_menu(column=4)
+
         elif source == "TCP Socket":
             tk.Label(self.param_frame, text="Host:", bg='#1a1f3a', fg='#ffffff').grid(row=0, column=0, padx=2)
             self.host_var = tk.StringVar(value="192.168.1.100")
@@ -392,6 +799,16 @@ class TelemetryGUI:
             self.socket_port_var = tk.StringVar(value="5000")
             tk.Entry(self.param_frame, textvariable=self.socket_port_var, width=8).grid(row=0, column=3, padx=2)
 
+            self.create_format_menu(column=4)
+
+    def create_format_menu(self, column):
+        """Add the wire format selector to the parameter frame"""
+        tk.Label(self.param_frame, text="Format:", bg='#1a1f3a', fg='#ffffff').grid(row=0, column=column, padx=2)
+        self.format_var = tk.StringVar(value="JSON")
+        format_menu = ttk.Combobox(self.param_frame, textvariable=self.format_var,
+                                   values=["JSON", "Binary"], width=7, state='readonly')
+        format_menu.grid(row=0, column=column + 1, padx=2)
+
     def toggle_connection(self):
         """Connect or disconnect from data source"""
         if not self.running:
@@ -403,188 +820,340 @@ class TelemetryGUI:
             elif source_type == "Serial Port":
                 port = self.port_var.get()
                 baud = int(self.baud_var.get())
-                self.data_source = SerialSource(port, baud)
+                self.data_source = SerialSource(port, baud, self.format_var.get().lower())
             elif source_type == "TCP Socket":
                 host = self.host_var.get()
                 port = int(self.socket_port_var.get())
-                self.data_source = TCPSocketSource(host, port)
+                self.data_source = TCPSocketSource(host, port, self.format_var.get().lower())
             else:
-                messagebox.showerror("Error", "Unknown source type")
+                self.log_error("Unknown source type")
                 return
 
             success, message = self.data_source.connect()
 
             if success:
                 self.running = True
-                self.reader_thread = threading.Thread(target=self.read_data_thread, daemon=True)
+                self._stop = threading.Event()
+                self.reader_thread = threading.Thread(target=self.read_data_thread,
+                                                      args=(self.data_source, self._stop),
+                                                      daemon=True)
                 self.reader_thread.start()
 
                 self.connect_btn.config(text="Disconnect", bg='#aa0000')
                 self.status_label.config(text="● CONNECTED", fg='#00ff00')
                 self.log_message(f"Connected: {message}")
             else:
-                messagebox.showerror("Connection Error", message)
+                self.log_error(f"Connection failed: {message}")
         else:
             # Disconnect
-            self.running = False
-            if self.data_source:
-                self.data_source.disconnect()
+            self.stop_reader()
 
             self.connect_btn.config(text="Connect", bg='#00aa44')
             self.status_label.config(text="● DISCONNECTED", fg='#ff4444')
             self.log_message("Disconnected")
 
-    def read_data_thread(self):
+    def check_connection(self):
+        """Switch to disconnected if the source's link dropped on its own"""
+        if self.running and self.data_source.lost:
+            self.stop_reader()
+            self.connect_btn.config(text="Connect", bg='#00aa44')
+            self.status_label.config(text="● DISCONNECTED", fg='#ff4444')
+            self.log_error(f"Connection lost: {self.data_source.lost}")
+
+    def stop_reader(self):
+        """Wake and stop the reader thread, then close the data source"""
+        self.running = False
+        self._stop.set()
+        if self.data_source:
+            self.data_source.disconnect()
+
+    def on_close(self):
+        """Shut the reader down before the window is destroyed"""
+        self.stop_reader()
+        if self.reader_thread:
+            self.reader_thread.join(timeout=0.5)
+        self.root.destroy()
+
+    def log_error(self, message):
+        """Report an error in the log and flash the status - never blocks the main loop"""
+        self.log_message(f"[ERROR] {message}")
+        if self._status_flash is None:
+            self._status_flash = (self.status_label.cget('text'), self.status_label.cget('fg'))
+        self.status_label.config(fg='#ff8844')
+        self.root.after(200, self.restore_status)
+
+    def restore_status(self):
+        """End an error flash, unless the status has moved on in the meantime"""
+        if self._status_flash is None:
+            return
+        text, color = self._status_flash
+        self._status_flash = None
+        if self.status_label.cget('text') == text:
+            self.status_label.config(fg=color)
+
+    def read_data_thread(self, source, stop):
         """Thread for reading data from source"""
-        while self.running:
+        # read_data blocks (or paces itself) until a sample is ready. Each
+        # connection gets its own stop event, so a quick disconnect/reconnect
+        # never leaves two readers running, and waiting on it instead of
+        # sleeping lets the thread exit as soon as it is set.
+        tune_reader_thread()
+        while not stop.is_set():
             try:
-                data = self.data_source.read_data()
+                data = source.read_data()
                 if data:
-                    self.data_queue.put(data)
-                time.sleep(0.05)  # 20 Hz
+                    if len(self.data_queue) == self.data_queue.maxlen:
+                        self.dropped += 1
+                    self.data_queue.append(data)
+                elif not source.connected:
+                    stop.wait(0.1)  # Link dropped - don't spin
             except Exception as e:
                 print(f"Read error: {e}")
-                time.sleep(0.1)
+                stop.wait(0.1)
 
     def update_gui(self):
         """Update GUI with new data"""
         try:
-            while not self.data_queue.empty():
-                data = self.data_queue.get_nowait()
-
-                # Update displays
-                if 'altitude' in data:
-                    self.altitude_value.config(text=f"{data['altitude']:.1f}")
-                    self.data_history['altitude'].append(data['altitude'])
-
-                if 'velocity' in data:
-                    self.velocity_value.config(text=f"{data['velocity']:.1f}")
-                    self.data_history['velocity'].append(data['velocity'])
-
-                if 'acceleration' in data:
-                    self.accel_value.config(text=f"{data['acceleration']:.1f}")
-                    self.data_history['acceleration'].append(data['acceleration'])
-
-                if 'temperature' in data:
-                    self.temp_value.config(text=f"{data['temperature']:.1f}")
-                    self.data_history['temperature'].append(data['temperature'])
-
-                if 'pressure' in data:
-                    self.pressure_value.config(text=f"{data['pressure']:.1f}")
-                    self.data_history['pressure'].append(data['pressure'])
-
-                if 'flight_time' in data:
-                    self.time_value.config(text=f"{data['flight_time']:.1f}")
-                    self.data_history['time'].append(data['flight_time'])
-
-                if 'phase' in data:
-                    self.phase_label.config(text=f"Phase: {data['phase']}")
-
-                # Log
-                log_msg = f"[{data.get('timestamp', datetime.now().strftime('%H:%M:%S'))}] "
-                log_msg += f"ALT:{data.get('altitude', 0):.1f}m VEL:{data.get('velocity', 0):.1f}m/s "
-                log_msg += data.get('phase', '--')
-                self.log_message(log_msg)
-
-                # Draw graphs
+            self.drain_queue()
+            self.check_connection()
+        finally:
+            # Run every 20 ms on a fixed schedule, so the time spent in here doesn't
+            # add up. After a stall, skip the missed updates instead of bursting.
+            # Rescheduled even if a bad packet raised, so ingest never stops.
+            self._next_update += 0.02
+            now = time.monotonic()
+            if self._next_update < now:
+                self._next_update = now
+            self.root.after(int((self._next_update - now) * 1000), self.update_gui)
+
+    def drain_queue(self):
+        """Move queued samples into the history, the latest snapshot and the log"""
+        batch = []
+        appended = {key: [] for key in self.data_history}
+
+        # Drain a bounded batch so a burst can't starve the Tk main loop. popleft
+        # on an empty deque raises, so there's no separate emptiness check.
+        for _ in range(MAX_DRAIN):
+            try:
+                data = self.data_queue.popleft()
+            except IndexError:
+                break
+            # Devices may send null, NaN or inf for a field they can't read - treat
+            # it as missing, so the cards, log and graph scaling only see real numbers
+            data = {field: value for field, value in data.items()
+                    if value is not None and (type(value) is not float or math.isfinite(value))}
+            batch.append(data)
+            self._latest.update(data)
+
+            # Every history row advances one slot per sample, with NaN for a field
+            # the packet left out, so slot i of each row is the same sample
+            if any(field in data for _, field in HISTORY_FIELDS):
+                for key, field in HISTORY_FIELDS:
+                    appended[key].append(data.get(field, math.nan))
+
+        for key, values in appended.items():
+            self.data_history[key].extend(values)
+
+        # Log - only the samples that will still be on screen are worth formatting
+        for data in batch[-self._log_buf.maxlen:]:
+            log_msg = f"[{data.get('timestamp') or timestamp()}] "
+            log_msg += f"ALT:{data.get('altitude', 0):.1f}m VEL:{data.get('velocity', 0):.1f}m/s "
+            phase = data.get('phase', '--')
+            log_msg += phase
+            self.log_message(log_msg, urgent=phase != self._log_phase)
+            self._log_phase = phase
+
+        if batch:
+            self._dirty = True
+
+        # Only the reader thread writes self.dropped, so just report the difference
+        dropped = self.dropped
+        if dropped != self._dropped_reported:
+            self.log_message(f"[WARN] GUI fell behind - dropped {dropped - self._dropped_reported} samples")
+            self._dropped_reported = dropped
+
+    def update_cards(self):
+        """Show the latest snapshot on the data cards"""
+        latest = self._latest
+
+        if 'altitude' in latest:
+            self.set_card('altitude_value', latest['altitude'])
+
+        if 'velocity' in latest:
+            self.set_card('velocity_value', latest['velocity'])
+
+        if 'acceleration' in latest:
+            self.set_card('accel_value', latest['acceleration'])
+
+        if 'temperature' in latest:
+            self.set_card('temp_value', latest['temperature'])
+
+        if 'pressure' in latest:
+            self.set_card('pressure_value', latest['pressure'])
+
+        if 'flight_time' in latest:
+            self.set_card('time_value', latest['flight_time'])
+
+        if 'phase' in latest and self._card_text.get('phase') != latest['phase']:
+            self._card_text['phase'] = latest['phase']
+            self.phase_var.set(f"Phase: {latest['phase']}")
+
+    def set_card(self, attr_name, value):
+        """Show a value on a data card, skipping the Tk call if the text is unchanged"""
+        text = format(value, '.1f')
+        if self._card_text.get(attr_name) != text:
+            self._card_text[attr_name] = text
+            getattr(self, f"{attr_name}_var").set(text)
+
+    def _render_tick(self):
+        """Schedule a redraw at a fixed frame rate if anything changed"""
+        if self._dirty or self._log_due():
+            self._schedule_render()
+
+        self.root.after(66, self._render_tick)
+
+    def _request_redraw(self):
+        """Redraw as soon as Tk is idle - for user actions that shouldn't wait a frame"""
+        self._dirty = True
+        self._schedule_render()
+
+    def _schedule_render(self):
+        """Queue one _render call; repeated requests before it runs are coalesced"""
+        if not self._render_pending:
+            # Draw once Tk has handled pending repaints rather than competing with them
+            self._render_pending = True
+            self.root.after_idle(self._render)
+
+    def _render(self):
+        """Redraw cards, graphs and log"""
+        self._render_pending = False
+
+        # A drawing error still lets the log through, and isn't retried every tick
+        try:
+            if self._dirty:
+                self._dirty = False
+                self.update_cards()
                 self.draw_graph("graph1")
                 self.draw_graph("graph2")
+        finally:
+            if self._log_due():
+                self.flush_log()
 
-        except queue.Empty:
-            pass
+    def flush_log(self):
+        """Show pending log lines"""
+        # Append only the new lines, then trim to the last 5 - no index parsing
+        self.log_text.config(state='normal')
+        self.log_text.insert('end', ''.join(line + '\n' for line in self._log_buf))
+        self.log_text.delete('1.0', 'end-6l')
+        self.log_text.see('end')
+        self.log_text.config(state='disabled')
+        self._log_buf.clear()
+        self._log_dirty = False
+        self._log_urgent = False
+        self._log_flushed = time.monotonic()
 
-        self.root.after(50, self.update_gui)
+    def _log_due(self):
+        """True if the log has new lines and it's time, or they can't wait, to show them"""
+        return self._log_dirty and (
+            self._log_urgent or time.monotonic() - self._log_flushed >= LOG_INTERVAL)
 
     def draw_graph(self, graph_name):
         """Draw graph with selected data"""
         canvas = getattr(self, f"{graph_name}_canvas")
-        y_var = getattr(self, f"{graph_name}_y_var").get()
-
-        canvas.delete('all')
-
-        if len(self.data_history['time']) < 2:
+        y_var = getattr(self, f"{graph_name}_y_field")
+        line_id = getattr(self, f"{graph_name}_line_id")
+
+        # Get data - only the samples that have both a time and a value
+        x_data = self.data_history['time'].window()
+        y_data = self.data_history[y_var].window()
+        if NUMPY_AVAILABLE:
+            finite = np.isfinite(x_data) & np.isfinite(y_data)
+            if not finite.all():
+                x_data, y_data = x_data[finite], y_data[finite]
+        else:
+            isfinite = math.isfinite
+            finite = [isfinite(x) and isfinite(y) for x, y in zip(x_data, y_data)]
+            if not all(finite):
+                x_data = [x for x, keep in zip(x_data, finite) if keep]
+                y_data = [y for y, keep in zip(y_data, finite) if keep]
+        n = len(x_data)
+
+        # Blank graph until the selected field has a line's worth of points
+        if n < 2:
+            if getattr(self, f"{graph_name}_visible"):
+                canvas.itemconfigure('all', state='hidden')
+                setattr(self, f"{graph_name}_visible", False)
             return
 
-        width = canvas.winfo_width()
-        height = canvas.winfo_height()
+        width, height = getattr(self, f"{graph_name}_size")
 
         if width < 10 or height < 10:
             return
 
-        # Get data
-        x_data = list(self.data_history['time'])
-        y_data = list(self.data_history[y_var])
-
-        if not y_data:
-            return
-
         # Calculate scaling
-        padding = 40
+        padding = GRAPH_PADDING
         graph_width = width - 2 * padding
         graph_height = height - 2 * padding
 
-        min_y = min(y_data)
-        max_y = max(y_data)
-        range_y = max_y - min_y if max_y != min_y else 1
+        if not getattr(self, f"{graph_name}_visible"):
+            canvas.itemconfigure('all', state='normal')
+            setattr(self, f"{graph_name}_visible", True)
 
-        min_x = min(x_data)
-        max_x = max(x_data)
+        # Keep the previous bucket while the data still fits it reasonably well
+        if NUMPY_AVAILABLE:
+            min_y, max_y = float(y_data.min()), float(y_data.max())
+        else:
+            min_y, max_y = min(y_data), max(y_data)
+        bucket = getattr(self, f"{graph_name}_last_bucket")
+        if (bucket is None or min_y < bucket[0] or max_y > bucket[1]
+                or max_y - min_y < (bucket[1] - bucket[0]) / 2):
+            bucket = y_bucket(min_y, max_y)
+        min_y, max_y = bucket
+        range_y = max_y - min_y
+
+        if NUMPY_AVAILABLE:
+            min_x, max_x = float(x_data.min()), float(x_data.max())
+        else:
+            min_x, max_x = min(x_data), max(x_data)
         range_x = max_x - min_x if max_x != min_x else 1
 
-        # Draw axes
-        canvas.create_line(padding, height - padding,
-                           width - padding, height - padding,
-                           fill='#444444', width=2)
-        canvas.create_line(padding, padding,
-                           padding, height - padding,
-                           fill='#444444', width=2)
-
-        # Draw grid and labels
-        for i in range(5):
-            y = padding + (graph_height * i / 4)
-            canvas.create_line(padding, y, width - padding, y,
-                               fill='#222222', dash=(2, 4))
-            val = max_y - (range_y * i / 4)
-            canvas.create_text(padding - 5, y, text=f"{val:.0f}",
-                               anchor='e', fill='#666666', font=('Arial', 8))
-
-        # Draw data line
-        if len(x_data) > 1:
+        # Tick labels are only retexted when the Y range leaves its bucket
+        if getattr(self, f"{graph_name}_last_bucket") != bucket:
+            for i, grid_label in enumerate(getattr(self, f"{graph_name}_grid_labels")):
+                val = max_y - (range_y * i / 4)
+                canvas.itemconfigure(grid_label, text=f"{val:.0f}")
+            setattr(self, f"{graph_name}_last_bucket", bucket)
+
+        # Move the data line
+        if NUMPY_AVAILABLE:
+            # Transform in place - no temporary arrays per frame
+            points = getattr(self, f"{graph_name}_points")[:2 * n]
+            xs, ys = points[0::2], points[1::2]
+            np.subtract(x_data, min_x, out=xs)
+            xs *= graph_width / range_x
+            xs += padding
+            np.subtract(y_data, min_y, out=ys)
+            ys *= -graph_height / range_y
+            ys += height - padding
+            # Whole pixels - Tk would round anyway, and ints pass to Tcl more cheaply
+            pixels = getattr(self, f"{graph_name}_pixels")[:2 * n]
+            np.rint(points, out=points)
+            pixels[:] = points
+            points = pixels.tolist()
+        else:
             points = []
-            for i in range(len(x_data)):
+            for i in range(n):
                 x = padding + ((x_data[i] - min_x) / range_x) * graph_width
                 y = height - padding - ((y_data[i] - min_y) / range_y) * graph_height
-                points.extend([x, y])
-
-            canvas.create_line(points, fill='#00ff88', width=2, smooth=True)
+                points.extend([round(x), round(y)])
 
-        # Labels
-        canvas.create_text(width / 2, height - 10,
-                           text="Flight Time (s)", fill='#888888', font=('Arial', 9))
+        canvas.coords(line_id, *points)
 
-        y_labels = {
-            'altitude': 'Altitude (m)',
-            'velocity': 'Velocity (m/s)',
-            'acceleration': 'Acceleration (m/s²)',
-            'temperature': 'Temperature (°C)',
-            'pressure': 'Pressure (kPa)'
-        }
-        canvas.create_text(15, height / 2,
-                           text=y_labels.get(y_var, y_var),
-                           fill='#888888', font=('Arial', 9), angle=90)
-
-    def log_message(self, message):
-        """Add message to log"""
-        self.log_text.config(state='normal')
-        self.log_text.insert('end', message + '\n')
-        self.log_text.see('end')
-
-        # Keep only last 5 lines
-        lines = int(self.log_text.index('end-1c').split('.')[0])
-        if lines > 5:
-            self.log_text.delete('1.0', f'{lines - 4}.0')
-
-        self.log_text.config(state='disabled')
+    def log_message(self, message, urgent=True):
+        """Add message to log - urgent ones show on the next render tick, others within a second"""
+        self._log_buf.append(message)
+        self._log_dirty = True
+        self._log_urgent = self._log_urgent or urgent
 
 
 if __name__ == "__main__":